@@ -18,6 +18,7 @@ let enemies = {};
 let obstacles = [];
 let bonuses = {};
 let scores = {};
+let serverTick = null;
 let gameSettings = { width: 800, height: 600, playerSize: 50, bulletSize: 5, enemySize: 40 };
 
 const WS_PORT = 8001;
@@ -145,6 +146,7 @@ function handleInitialState(data) {
     obstacles = data.obstacles || [];
     bonuses = data.bonuses || {};
     scores = data.scores || {};
+    if (data.tick !== undefined) serverTick = data.tick;
     if (data.gameSettings) {
         gameSettings = data.gameSettings;
         if (gameStarted && canvas.width !== gameSettings.width) canvas.width = gameSettings.width;
@@ -160,6 +162,7 @@ function handleGameUpdate(data) {
     if (data.enemies !== undefined) enemies = data.enemies;
     if (data.bonuses !== undefined) bonuses = data.bonuses;
     if (data.scores !== undefined) scores = data.scores;
+    if (data.tick !== undefined) serverTick = data.tick;
     updateUI();
 }
 
@@ -201,7 +204,7 @@ canvas.addEventListener('mousedown', (e) => {
             const mouseY = e.clientY - rect.top;
             socket.send(JSON.stringify({
                 type: 'player_input',
-                data: { shoot: true, target: { x: mouseX, y: mouseY }, keys: keysPressed }
+                data: { shoot: true, target: { x: mouseX, y: mouseY }, keys: keysPressed, view_tick: serverTick }
             }));
         }
     }
@@ -0,0 +1,124 @@
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+
+# --- Конфигурация логирования ---
+LOG_LEVEL = logging.INFO
+LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+LOG_QUEUE_SIZE = 10000
+LOG_STOP_TIMEOUT_SEC = 2.0
+
+# Лимиты по типам сообщений: ключ -> (burst, сообщений в секунду).
+# Ключ берется из extra={'rate_key': ...}, иначе используется шаблон сообщения.
+RATE_LIMITS = {
+    'bad_message': (5, 0.5),
+    'message_error': (5, 0.5),
+}
+DEFAULT_RATE_LIMIT = (20, 10.0)
+
+_log_queue = queue.Queue(LOG_QUEUE_SIZE)
+_listener = None
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket на каждый тип сообщения; отброшенные записи подсчитываются
+    и упоминаются в следующей пропущенной записи того же типа."""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def filter(self, record):
+        key = getattr(record, 'rate_key', record.msg)
+        burst, rate = RATE_LIMITS.get(key, DEFAULT_RATE_LIMIT)
+        now = time.monotonic()
+        with self._lock:
+            tokens, last_time, suppressed = self._buckets.get(key, (burst, now, 0))
+            tokens = min(burst, tokens + (now - last_time) * rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now, suppressed + 1)
+                return False
+            self._buckets[key] = (tokens - 1, now, 0)
+        if suppressed:
+            record.msg = f"{record.msg} (подавлено похожих сообщений: {suppressed})"
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Кладет записи в очередь без ожидания; при переполнении запись отбрасывается,
+    а число отброшенных записей дописывается к следующей попавшей в очередь."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self._lock = threading.Lock()
+        self.dropped_count = 0
+        self._unreported_drops = 0
+
+    def count_dropped(self, count=1):
+        with self._lock:
+            self.dropped_count += count
+            self._unreported_drops += count
+
+    def enqueue(self, record):
+        with self._lock:
+            unreported = self._unreported_drops
+            if unreported:
+                record.msg = f"{record.msg} (отброшено записей из-за переполнения очереди: {unreported})"
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped_count += 1
+                self._unreported_drops += 1
+                return
+            self._unreported_drops = 0
+
+
+_queue_handler = NonBlockingQueueHandler(_log_queue)
+_queue_handler.addFilter(RateLimitFilter())
+
+_root_logger = logging.getLogger('game')
+_root_logger.setLevel(LOG_LEVEL)
+_root_logger.addHandler(_queue_handler)
+_root_logger.propagate = False
+
+
+def get_logger(name):
+    return _root_logger.getChild(name)
+
+
+def start():
+    """Запускает фоновый поток, который выводит записи из очереди в stdout."""
+    global _listener
+    if _listener: return
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _listener = logging.handlers.QueueListener(_log_queue, stream_handler)
+    _listener.start()
+
+
+def stop(timeout=LOG_STOP_TIMEOUT_SEC):
+    """Дописывает оставшиеся записи и останавливает фоновый поток, ожидая не дольше timeout."""
+    global _listener
+    if not _listener: return
+    listener = _listener
+    _listener = None
+    try:
+        listener.enqueue_sentinel()
+    except queue.Full:
+        # Писатель отстал: освобождаем место под маркер остановки за счет одной записи
+        try:
+            _log_queue.get_nowait()
+            _queue_handler.count_dropped()
+        except queue.Empty:
+            pass
+        try:
+            listener.enqueue_sentinel()
+        except queue.Full:
+            pass
+    listener._thread.join(timeout)
+    if _queue_handler.dropped_count:
+        print(f"Лог: отброшено записей из-за переполнения очереди: {_queue_handler.dropped_count}", file=sys.stderr)
@@ -2,6 +2,11 @@ import random
 import math
 import uuid
 import threading
+from array import array
+
+import game_log
+
+log = game_log.get_logger('logic')
 
 # --- Игровые константы ---
 WIDTH, HEIGHT = 800, 600
@@ -27,6 +32,19 @@ BONUS_SPAWN_TIMER_MS = 0
 BONUS_SPAWN_RATE_MS = 10000
 MAX_BONUSES = 3
 
+# --- Компенсация задержки (lag compensation) ---
+LAG_COMPENSATION_MAX_REWIND_MS = 200
+POSITION_HISTORY_SIZE = math.ceil(LAG_COMPENSATION_MAX_REWIND_MS / (GAME_TICK_RATE * 1000)) + 1
+ENEMY_HISTORY_CAPACITY = DIFFICULTY["max_enemies"]
+
+game_tick = 0
+# Кольцевой буфер позиций врагов по тикам. Слоты выделяются один раз и
+# перезаписываются на месте: id врагов и плоский массив координат x0, y0, x1, y1, ...
+_history_ticks = array('q', [-1] * POSITION_HISTORY_SIZE)
+_history_counts = array('i', [0] * POSITION_HISTORY_SIZE)
+_history_ids = [[None] * ENEMY_HISTORY_CAPACITY for _ in range(POSITION_HISTORY_SIZE)]
+_history_coords = [array('d', [0.0] * (2 * ENEMY_HISTORY_CAPACITY)) for _ in range(POSITION_HISTORY_SIZE)]
+
 # --- Вспомогательные игровые функции ---
 def check_rect_collision(rect1, rect2):
     return (rect1['x'] < rect2['x'] + rect2['width'] and
@@ -49,7 +67,50 @@ def generate_initial_obstacles():
                 if check_rect_collision(new_obs_rect, player_spawn_area): continue
                 if any(check_rect_collision(new_obs_rect, obs) for obs in game_obstacles): continue
                 game_obstacles.append(new_obs_rect); break
-    print(f"Игра: Сгенерировано {len(game_obstacles)} препятствий.")
+    log.info("Игра: Сгенерировано %d препятствий.", len(game_obstacles))
+
+def _record_enemy_positions(tick):
+    slot = tick % POSITION_HISTORY_SIZE
+    ids = _history_ids[slot]
+    coords = _history_coords[slot]
+    count = 0
+    for eid, enemy in game_enemies.items():
+        if count >= ENEMY_HISTORY_CAPACITY: break
+        ids[count] = eid
+        coords[2 * count] = enemy['x']; coords[2 * count + 1] = enemy['y']
+        count += 1
+    _history_counts[slot] = count
+    _history_ticks[slot] = tick
+
+def _rewind_bullet(bullet, view_tick):
+    """Прогоняет начальный участок траектории пули по позициям врагов, которые видел клиент.
+    Возвращает True, если пуля израсходована (попадание или препятствие), иначе пуля
+    оказывается там, где была бы без задержки, и дальше летит как обычно."""
+    rewind_ticks = min(game_tick - view_tick, POSITION_HISTORY_SIZE - 1)
+    if rewind_ticks <= 0: return False
+    first_tick = game_tick - rewind_ticks
+
+    for step in range(1, rewind_ticks + 1):
+        bullet['x'] += bullet['vx']
+        bullet['y'] += bullet['vy']
+        if not (0 < bullet['x'] < WIDTH and 0 < bullet['y'] < HEIGHT) or \
+           any(check_rect_collision(bullet, obs) for obs in game_obstacles):
+            return True
+
+        tick = first_tick + step
+        slot = tick % POSITION_HISTORY_SIZE
+        if _history_ticks[slot] != tick: continue
+        ids = _history_ids[slot]
+        coords = _history_coords[slot]
+        for i in range(_history_counts[slot]):
+            eid = ids[i]
+            if eid not in game_enemies: continue
+            ex = coords[2 * i]; ey = coords[2 * i + 1]
+            if (ex < bullet['x'] + BULLET_SIZE and ex + ENEMY_SIZE > bullet['x'] and
+                    ey < bullet['y'] + BULLET_SIZE and ey + ENEMY_SIZE > bullet['y']):
+                _award_enemy_kill(game_enemies.pop(eid), bullet['owner_sid'])
+                return True
+    return False
 
 # --- Функции обратного вызова для сервера ---
 broadcast_callback_func = None
@@ -66,7 +127,7 @@ def reset_simple_game_over_state():
         is_game_over = False
         ENEMY_SPAWN_TIMER_MS = 0
         BONUS_SPAWN_TIMER_MS = 0
-    print("Игра: Состояние Game Over сброшено (основные игровые объекты очищены).")
+    log.info("Игра: Состояние Game Over сброшено (основные игровые объекты очищены).")
 
 def set_broadcast_callback(callback_func):
     global broadcast_callback_func
@@ -76,7 +137,7 @@ def _broadcast_message(payload_obj):
     if broadcast_callback_func:
         broadcast_callback_func(payload_obj)
     else:
-        print("ПРЕДУПРЕЖДЕНИЕ (Игра): broadcast_callback не установлен!")
+        log.warning("Игра: broadcast_callback не установлен!")
 
 # --- Функции для управления состоянием игры, вызываемые из server_core ---
 def handle_player_connect(client_id, player_name):
@@ -94,7 +155,7 @@ def handle_player_connect(client_id, player_name):
     initial_data_for_new_player = {
         'playerId': client_id, 'players': game_players, 'bullets': game_bullets,
         'enemies': game_enemies, 'obstacles': game_obstacles, 'bonuses': game_bonuses,
-        'scores': game_scores,
+        'scores': game_scores, 'tick': game_tick,
         'gameSettings': { 'width': WIDTH, 'height': HEIGHT, 'playerSize': PLAYER_SIZE, 'bulletSize': BULLET_SIZE, 'enemySize': ENEMY_SIZE}
     }
     
@@ -149,11 +210,15 @@ def handle_player_input(client_id, input_data):
             dist = math.hypot(angle_dx, angle_dy)
             vel_x, vel_y = (0, -10) if dist == 0 else ((angle_dx/dist)*10, (angle_dy/dist)*10)
 
-            game_bullets[bullet_id] = {
+            bullet = {
                 'id': bullet_id, 'owner_sid': client_id,
                 'x': start_x - BULLET_SIZE/2, 'y': start_y - BULLET_SIZE/2,
                 'width': BULLET_SIZE, 'height': BULLET_SIZE, 'vx': vel_x, 'vy': vel_y
             }
+            view_tick = input_data.get('view_tick')
+            if isinstance(view_tick, int) and not isinstance(view_tick, bool):
+                if _rewind_bullet(bullet, view_tick): return None
+            game_bullets[bullet_id] = bullet
     return None
 
 def _spawn_bonus_at_location(x, y):
@@ -180,8 +245,13 @@ def _apply_bonus_effect_to_player(player_id, bonus_type):
         _broadcast_message({'type': 'message', 'data': {'text': message_text, 'msg_type': 'success'}})
 
 
+def _award_enemy_kill(enemy, owner_sid):
+    if owner_sid in game_scores: game_scores[owner_sid] += 10
+    if random.random() < 0.20: _spawn_bonus_at_location(enemy['x'], enemy['y'])
+
+
 def update_game_state(delta_time_sec):
-    global ENEMY_SPAWN_TIMER_MS, BONUS_SPAWN_TIMER_MS
+    global ENEMY_SPAWN_TIMER_MS, BONUS_SPAWN_TIMER_MS, game_tick
     
     dt_ms = delta_time_sec * 1000
 
@@ -246,7 +316,7 @@ def update_game_state(delta_time_sec):
                     if player_data['hp'] <= 0:
                         player_data['is_dead'] = True
                         player_data['color'] = "#808080"
-                        print(f"Игра: Игрок {pid} ({player_data.get('name', pid)}) погиб.")
+                        log.info("Игра: Игрок %s (%s) погиб.", pid, player_data.get('name', pid))
                         events_for_broadcast.append({'type': 'message', 'data': {'text': f"{player_data.get('name', pid)} был повержен!", 'msg_type': 'warning'}})
                     enemies_to_remove.append(eid); break 
             
@@ -254,10 +324,9 @@ def update_game_state(delta_time_sec):
 
             for bid, bullet in list(game_bullets.items()):
                 if check_rect_collision(enemy, bullet):
-                    if bullet['owner_sid'] in game_scores: game_scores[bullet['owner_sid']] += 10
+                    _award_enemy_kill(enemy, bullet['owner_sid'])
                     enemies_to_remove.append(eid)
                     if bid in game_bullets: del game_bullets[bid]
-                    if random.random() < 0.20: _spawn_bonus_at_location(enemy['x'], enemy['y'])
                     break 
         
         for eid in set(enemies_to_remove):
@@ -277,10 +346,14 @@ def update_game_state(delta_time_sec):
         for b_id in bonuses_to_remove:
             if b_id in game_bonuses: del game_bonuses[b_id]
 
-        # 6. Формирование текущего состояния для отправки
+        # 6. Запись позиций врагов для компенсации задержки
+        game_tick += 1
+        _record_enemy_positions(game_tick)
+
+        # 7. Формирование текущего состояния для отправки
         current_snapshot = {
             'players': game_players, 'bullets': game_bullets, 'enemies': game_enemies,
-            'bonuses': game_bonuses, 'scores': game_scores
+            'bonuses': game_bonuses, 'scores': game_scores, 'tick': game_tick
         }
     
     for event_payload in events_for_broadcast:
@@ -289,4 +362,4 @@ def update_game_state(delta_time_sec):
     return current_snapshot
 
 generate_initial_obstacles()
-print("Модуль game_logic инициализирован.")
\ No newline at end of file
+log.info("Модуль game_logic инициализирован.")
\ No newline at end of file
@@ -7,8 +7,11 @@ import struct
 import json
 import os
 
+import game_log
 import game_logic
 
+log = game_log.get_logger('server')
+
 # --- Конфигурация сервера ---
 HTTP_HOST = '0.0.0.0'
 HTTP_PORT = 8000
@@ -83,7 +86,7 @@ def handle_http_request(client_socket):
             client_socket.sendall(response)
             
     except Exception as e:
-        print(f"HTTP Request Error: {e}")
+        log.error("HTTP Request Error: %s", e)
     finally:
         client_socket.close()
 
@@ -93,8 +96,8 @@ def run_http_server():
     try:
         server_socket.bind((HTTP_HOST, HTTP_PORT))
         server_socket.listen(5)
-        print(f"HTTP сервер запущен на http://{HTTP_HOST}:{HTTP_PORT}\n")
-        print(f"Отдает файлы из: {os.path.abspath(WEB_DIR)}")
+        log.info("HTTP сервер запущен на http://%s:%s", HTTP_HOST, HTTP_PORT)
+        log.info("Отдает файлы из: %s", os.path.abspath(WEB_DIR))
 
         while True:
             client_socket, addr = server_socket.accept()
@@ -102,9 +105,9 @@ def run_http_server():
             http_thread.daemon = True
             http_thread.start()
     except OSError as e:
-        print(f"ОШИБКА HTTP СЕРВЕРА: Не удалось запустить сервер на {HTTP_HOST}:{HTTP_PORT}. {e}")
+        log.error("ОШИБКА HTTP СЕРВЕРА: Не удалось запустить сервер на %s:%s. %s", HTTP_HOST, HTTP_PORT, e)
     except KeyboardInterrupt:
-        print("HTTP сервер останавливается...")
+        log.info("HTTP сервер останавливается...")
     finally:
         server_socket.close()
 
@@ -208,7 +211,7 @@ def send_to_one_client_by_conn(conn, payload_obj):
         json_str = json.dumps(payload_obj)
         _send_ws_frame_to_conn(conn, json_str)
     except Exception as e:
-        print(f"WS Core: Ошибка отправки клиенту: {e}")
+        log.error("WS Core: Ошибка отправки клиенту: %s", e)
 
 def broadcast_to_all_ws_clients(payload_obj, exclude_conn=None):
     """Отправляет JSON объект всем подключенным WebSocket клиентам."""
@@ -216,7 +219,7 @@ def broadcast_to_all_ws_clients(payload_obj, exclude_conn=None):
     try:
         json_str = json.dumps(payload_obj)
     except TypeError as e:
-        print(f"WS Core: Ошибка сериализации JSON при broadcast: {e}, Payload: {payload_obj}")
+        log.error("WS Core: Ошибка сериализации JSON при broadcast: %s, Payload: %s", e, payload_obj)
         return
 
     with ws_clients_lock:
@@ -253,7 +256,7 @@ def handle_websocket_client_connection(conn, addr):
             client_session_data = {'id': session_id, 'addr': addr, 'status': 'connected', 'name': None, 'game_id': None}
             ws_clients[conn] = client_session_data
         
-        print(f"WS Core: Сессия {client_session_data['id']} ({addr}) подключена, ожидает входа в игру.")
+        log.info("WS Core: Сессия %s (%s) подключена, ожидает входа в игру.", client_session_data['id'], addr)
 
         conn.settimeout(1.0)
         while True:
@@ -278,7 +281,7 @@ def handle_websocket_client_connection(conn, addr):
                         client_session_data['status'] = 'ingame'
                         client_session_data['game_id'] = client_session_data['id'] 
                         
-                        print(f"WS Core: Клиент {client_session_data['game_id']} (был {client_session_data['id']}) входит в игру как '{player_name_from_client}'.")
+                        log.info("WS Core: Клиент %s (был %s) входит в игру как '%s'.", client_session_data['game_id'], client_session_data['id'], player_name_from_client)
 
                         initial_state_data, new_player_data = game_logic.handle_player_connect(
                             client_session_data['game_id'],
@@ -294,12 +297,12 @@ def handle_websocket_client_connection(conn, addr):
                             game_logic.handle_player_input(client_session_data['game_id'], msg_data)
 
                 except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                    print(f"WS Core: Некорректные данные от {client_session_data['id']}: {e}")
+                    log.warning("WS Core: Некорректные данные от %s: %s", client_session_data['id'], e, extra={'rate_key': 'bad_message'})
                 except Exception as e_inner:
-                     print(f"WS Core: Ошибка обработки сообщения от {client_session_data['id']}: {e_inner}")
+                     log.error("WS Core: Ошибка обработки сообщения от %s: %s", client_session_data['id'], e_inner, extra={'rate_key': 'message_error'})
             
             elif opcode == OPCODE_CLOSE:
-                print(f"WS Core: Клиент {client_session_data['id']} запросил закрытие.")
+                log.info("WS Core: Клиент %s запросил закрытие.", client_session_data['id'])
                 break
             elif opcode == OPCODE_PING:
                 _send_ws_frame_to_conn(conn, payload_bytes, opcode=OPCODE_PONG)
@@ -307,10 +310,10 @@ def handle_websocket_client_connection(conn, addr):
     except socket.error: pass
     except Exception as e_outer:
         session_id_for_log = client_session_data.get('id', addr) if client_session_data else addr
-        print(f"WS Core: Общая ошибка с клиентом {session_id_for_log}: {e_outer}")
+        log.error("WS Core: Общая ошибка с клиентом %s: %s", session_id_for_log, e_outer)
     finally:
         if client_session_data:
-            print(f"WS Core: Сессия {client_session_data['id']} отключается.")
+            log.info("WS Core: Сессия %s отключается.", client_session_data['id'])
             if client_session_data.get('status') == 'ingame' and client_session_data.get('game_id'):
                 game_id_on_disconnect = client_session_data['game_id']
                 _, disconnected_player_name = game_logic.handle_player_disconnect(game_id_on_disconnect)
@@ -318,7 +321,7 @@ def handle_websocket_client_connection(conn, addr):
                      broadcast_to_all_ws_clients({'type': 'player_left', 'data': game_id_on_disconnect})
                      broadcast_to_all_ws_clients({'type': 'message', 'data': {'text': f'{disconnected_player_name or game_id_on_disconnect} покинул игру.', 'msg_type': 'info'}})
         else:
-            print(f"WS Core: Клиент с {addr} отключается (рукопожатие не завершено или сессия не создана).")
+            log.info("WS Core: Клиент с %s отключается (рукопожатие не завершено или сессия не создана).", addr)
         
         with ws_clients_lock:
             if conn in ws_clients:
@@ -331,7 +334,7 @@ def run_websocket_server():
     try:
         server_socket.bind((WEBSOCKET_HOST, WEBSOCKET_PORT))
         server_socket.listen(5)
-        print(f"WebSocket сервер запущен на ws://{WEBSOCKET_HOST}:{WEBSOCKET_PORT}\n")
+        log.info("WebSocket сервер запущен на ws://%s:%s", WEBSOCKET_HOST, WEBSOCKET_PORT)
 
         while True:
             conn, addr = server_socket.accept()
@@ -339,9 +342,9 @@ def run_websocket_server():
             ws_client_thread.daemon = True
             ws_client_thread.start()
     except OSError as e:
-        print(f"ОШИБКА WEBSOCKET СЕРВЕРА: Не удалось запустить сервер на {WEBSOCKET_HOST}:{WEBSOCKET_PORT}. {e}")
+        log.error("ОШИБКА WEBSOCKET СЕРВЕРА: Не удалось запустить сервер на %s:%s. %s", WEBSOCKET_HOST, WEBSOCKET_PORT, e)
     except KeyboardInterrupt:
-        print("WebSocket сервер останавливается...")
+        log.info("WebSocket сервер останавливается...")
     finally:
         server_socket.close()
 
@@ -349,7 +352,7 @@ def run_websocket_server():
 # Основной цикл сервера (интеграция с game_logic)
 # ==============================================================================
 def server_main_loop():
-    print("Основной цикл сервера запущен.")
+    log.info("Основной цикл сервера запущен.")
     last_tick_time = time.perf_counter()
 
     game_logic.set_broadcast_callback(broadcast_to_all_ws_clients)
@@ -375,7 +378,8 @@ def server_main_loop():
 # Запуск Сервера
 # ==============================================================================
 if __name__ == "__main__":
-    print("Запуск серверных компонентов...")
+    game_log.start()
+    log.info("Запуск серверных компонентов...")
     http_server_thread = threading.Thread(target=run_http_server, name="HTTPServerThread", daemon=True)
     http_server_thread.start()
     websocket_server_thread = threading.Thread(target=run_websocket_server, name="WebSocketServerThread", daemon=True)
@@ -383,10 +387,9 @@ if __name__ == "__main__":
     try:
         server_main_loop()
     except KeyboardInterrupt:
-        print("Сервер останавливается по KeyboardInterrupt (в основном потоке)...")
+        log.info("Сервер останавливается по KeyboardInterrupt (в основном потоке)...")
     except Exception as e_main:
-        print(f"Критическая ошибка в server_main_loop: {e_main}")
-        import traceback
-        traceback.print_exc()
+        log.exception("Критическая ошибка в server_main_loop: %s", e_main)
     finally:
-        print("Завершение работы сервера (основной поток)...")
\ No newline at end of file
+        log.info("Завершение работы сервера (основной поток)...")
+        game_log.stop()
\ No newline at end of file